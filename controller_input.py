@@ -7,15 +7,34 @@ Optimized for Raspberry Pi Zero W
 
 import asyncio
 import logging
+from pathlib import Path
 from typing import Optional, Dict, Callable
 from evdev import InputDevice, categorize, ecodes, list_devices
 
 logger = logging.getLogger(__name__)
 
+# Event types handled by process_event (cached to avoid attribute lookups per event)
+_EV_ABS = ecodes.EV_ABS
+_EV_KEY = ecodes.EV_KEY
+
+# Where find_controller() remembers the last discovered device path
+_CONTROLLER_CACHE_FILE = Path('~/.cache/rvr_controller_path').expanduser()
+
 
 class ControllerInput:
     """Handles controller input using evdev."""
 
+    # Fixed attribute layout: state is read and written on every event
+    __slots__ = (
+        'config', 'device', 'running', 'event_codes', '_handlers',
+        'right_trigger', 'left_trigger', 'left_stick_x',
+        'button_a', 'button_b', 'button_x', 'button_y',
+        'deadzone', 'trigger_threshold', 'drive_update_interval',
+        '_stick_deadzone_pos', '_stick_deadzone_neg', '_stick_span_pos', '_stick_span_neg',
+        'on_drive_update', 'on_button_press',
+        '_drive_event', '_stopped', '_button_tasks',
+    )
+
     def __init__(self, config: dict):
         """
         Initialize controller input handler.
@@ -39,42 +58,112 @@ class ControllerInput:
             'button_y': getattr(ecodes, config['event_codes']['button_y']),
         }
 
-        # Current controller state
-        self.state = {
-            'right_trigger': 0,    # 0-255
-            'left_trigger': 0,     # 0-255
-            'left_stick_x': 0,     # -255 to 255
-            'button_a': False,
-            'button_b': False,
-            'button_x': False,
-            'button_y': False,
+        # Dispatch table: raw event code -> handler (left_stick_y is unused)
+        self._handlers: Dict[int, Callable] = {
+            self.event_codes['right_trigger']: self._on_right_trigger,
+            self.event_codes['left_trigger']: self._on_left_trigger,
+            self.event_codes['left_stick_x']: self._on_left_stick_x,
+            self.event_codes['button_a']: self._on_button_a,
+            self.event_codes['button_b']: self._on_button_b,
+            self.event_codes['button_x']: self._on_button_x,
+            self.event_codes['button_y']: self._on_button_y,
         }
 
+        # Current controller state
+        self.right_trigger = 0    # 0-255
+        self.left_trigger = 0     # 0-255
+        self.left_stick_x = 0     # -255 to 255
+        self.button_a = False
+        self.button_b = False
+        self.button_x = False
+        self.button_y = False
+
         # Deadzone and threshold from config
         self.deadzone = config.get('deadzone', 5) / 100.0
         self.trigger_threshold = config.get('trigger_threshold', 10)
 
+        # Minimum interval between drive updates; events within it are coalesced
+        self.drive_update_interval = config.get('drive_update_interval', 0.02)
+
+        # Deadzone edges (raw stick units) and the travel beyond them, so the
+        # steering handler is a compare, a subtract, a multiply and a divide
+        self._stick_deadzone_pos = int(self.deadzone * 32767)
+        self._stick_deadzone_neg = -int(self.deadzone * 32768)
+        self._stick_span_pos = 32767 - self._stick_deadzone_pos
+        self._stick_span_neg = 32768 + self._stick_deadzone_neg
+
         # Callbacks
         self.on_drive_update: Optional[Callable] = None
         self.on_button_press: Optional[Callable] = None
 
+        # Set when trigger/steering state changes; consumed by _drive_pump()
+        self._drive_event = asyncio.Event()
+
+        # Resolved by stop() or a read error to end run()
+        self._stopped: Optional[asyncio.Future] = None
+        # Pending button callback tasks (strong references until done)
+        self._button_tasks = set()
+
     def find_controller(self) -> Optional[str]:
         """
         Find controller device automatically.
 
+        Tries the device path cached by a previous run first, and only
+        enumerates all input devices if that path is missing or no longer
+        matches the configured name.
+
         Returns:
             Device path if found, None otherwise
         """
         device_name = self.config.get('device_name', 'Victrix')
-        devices = [InputDevice(path) for path in list_devices()]
 
-        for device in devices:
-            if device_name.lower() in device.name.lower():
-                logger.info(f"Found controller: {device.name} at {device.path}")
-                return device.path
+        try:
+            cached_path = _CONTROLLER_CACHE_FILE.read_text().strip()
+            device = InputDevice(cached_path)
+            try:
+                if device_name.lower() in device.name.lower():
+                    logger.info("Found controller: %s at %s", device.name, device.path)
+                    return device.path
+            finally:
+                device.close()
+        except OSError:
+            pass
+
+        device_path = self._discover_controller(device_name)
+        if device_path:
+            try:
+                _CONTROLLER_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+                _CONTROLLER_CACHE_FILE.write_text(device_path)
+            except OSError as e:
+                logger.debug("Could not cache controller path: %s", e)
+        return device_path
+
+    def _discover_controller(self, device_name: str) -> Optional[str]:
+        """
+        Enumerate input devices for one whose name matches device_name.
+
+        Args:
+            device_name: Case-insensitive name pattern to match
 
-        logger.error(f"Controller with name pattern '{device_name}' not found")
-        logger.info(f"Available devices: {[d.name for d in devices]}")
+        Returns:
+            Device path if found, None otherwise
+        """
+        names = []
+        for path in list_devices():
+            try:
+                device = InputDevice(path)
+            except OSError:
+                continue
+            try:
+                if device_name.lower() in device.name.lower():
+                    logger.info("Found controller: %s at %s", device.name, device.path)
+                    return device.path
+                names.append(device.name)
+            finally:
+                device.close()
+
+        logger.error("Controller with name pattern '%s' not found", device_name)
+        logger.info("Available devices: %s", names)
         return None
 
     async def connect(self) -> bool:
@@ -93,151 +182,178 @@ class ControllerInput:
 
         try:
             self.device = InputDevice(device_path)
-            logger.info(f"Connected to controller: {self.device.name}")
-            logger.info(f"Device capabilities: {self.device.capabilities(verbose=True)}")
+            logger.info("Connected to controller: %s", self.device.name)
+            logger.info("Device capabilities: %s", self.device.capabilities(verbose=True))
             return True
         except Exception as e:
-            logger.error(f"Failed to connect to controller at {device_path}: {e}")
+            logger.error("Failed to connect to controller at %s: %s", device_path, e)
             return False
 
-    def normalize_trigger(self, raw_value: int, max_raw: int = 255) -> int:
+    def process_event(self, event):
         """
-        Normalize trigger value to 0-255 range with threshold.
+        Process a single controller event.
 
-        Args:
-            raw_value: Raw trigger value from controller
-            max_raw: Maximum raw value
+        Only updates state; drive updates are sent by _drive_pump() and button
+        callbacks are scheduled as tasks, so this never blocks the reader.
 
-        Returns:
-            Normalized value 0-255
+        Args:
+            event: evdev InputEvent
         """
-        # Normalize to 0-255
-        normalized = int((raw_value / max_raw) * 255)
-
-        # Apply threshold
-        if normalized < self.trigger_threshold:
-            return 0
+        etype, ecode, evalue = event.type, event.code, event.value
+        if etype != _EV_ABS and etype != _EV_KEY:
+            return
 
-        return normalized
+        handler = self._handlers.get(ecode)
+        if handler:
+            handler(evalue)
+
+    def _notify_button_press(self, button: str):
+        """Schedule the button press callback without blocking event processing."""
+        if self.on_button_press:
+            task = asyncio.ensure_future(self.on_button_press(button, True))
+            self._button_tasks.add(task)
+            task.add_done_callback(self._on_button_task_done)
+
+    def _on_button_task_done(self, task: asyncio.Task):
+        """Forget a finished button callback task, logging any error it raised."""
+        self._button_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Error in button press callback: %s", task.exception())
+
+    def _on_readable(self):
+        """Drain all currently available events from the device in one pass."""
+        process_event = self.process_event
+        try:
+            for event in self.device.read():
+                process_event(event)
+        except BlockingIOError:
+            # Spurious wakeup, nothing queued
+            pass
+        except Exception as e:
+            # Device unplugged or read error - end run()
+            if not self._stopped.done():
+                self._stopped.set_exception(e)
 
-    def normalize_stick(self, raw_value: int, min_raw: int = -32768, max_raw: int = 32767) -> int:
+    async def _drive_pump(self):
         """
-        Normalize stick value to -255 to 255 range with deadzone.
+        Send coalesced drive updates to the drive callback.
 
-        Args:
-            raw_value: Raw stick value from controller
-            min_raw: Minimum raw value
-            max_raw: Maximum raw value
-
-        Returns:
-            Normalized value -255 to 255
+        Axis handlers only flag that state changed; this task waits for the
+        flag, lets further events in the same burst accumulate for
+        drive_update_interval, then sends the latest state once. This bounds
+        the drive command rate regardless of how fast the controller reports.
         """
-        # Normalize to -1.0 to 1.0
-        if raw_value >= 0:
-            normalized = raw_value / max_raw
+        while True:
+            await self._drive_event.wait()
+            await asyncio.sleep(self.drive_update_interval)
+            self._drive_event.clear()
+            if self.on_drive_update:
+                try:
+                    await self.on_drive_update(
+                        self.right_trigger,
+                        self.left_trigger,
+                        self.left_stick_x
+                    )
+                except Exception as e:
+                    logger.error("Error in drive update callback: %s", e)
+
+    def _on_right_trigger(self, value: int):
+        """Handle right trigger (throttle) axis event."""
+        # Triggers report 0-255; values below the threshold count as released
+        normalized = value if value >= self.trigger_threshold else 0
+        if normalized != self.right_trigger:
+            self.right_trigger = normalized
+            self._drive_event.set()
+
+    def _on_left_trigger(self, value: int):
+        """Handle left trigger (reverse) axis event."""
+        normalized = value if value >= self.trigger_threshold else 0
+        if normalized != self.left_trigger:
+            self.left_trigger = normalized
+            self._drive_event.set()
+
+    def _on_left_stick_x(self, value: int):
+        """Handle left stick X (steering) axis event."""
+        # Apply deadzone, then rescale the remaining travel to -255 to 255 so
+        # output ramps up smoothly from the deadzone edge instead of jumping
+        if value > self._stick_deadzone_pos:
+            normalized = (value - self._stick_deadzone_pos) * 255 // self._stick_span_pos
+        elif value < self._stick_deadzone_neg:
+            normalized = -((self._stick_deadzone_neg - value) * 255 // self._stick_span_neg)
         else:
-            normalized = raw_value / abs(min_raw)
-
-        # Apply deadzone
-        if abs(normalized) < self.deadzone:
-            return 0
+            normalized = 0
+        if normalized != self.left_stick_x:
+            self.left_stick_x = normalized
+            self._drive_event.set()
+
+    def _on_button_a(self, value: int):
+        """Handle A button event."""
+        if value == 1 and not self.button_a:  # Button pressed
+            self.button_a = True
+            self._notify_button_press('a')
+        elif value == 0:
+            self.button_a = False
+
+    def _on_button_b(self, value: int):
+        """Handle B button event."""
+        if value == 1 and not self.button_b:
+            self.button_b = True
+            self._notify_button_press('b')
+        elif value == 0:
+            self.button_b = False
+
+    def _on_button_x(self, value: int):
+        """Handle X button event."""
+        if value == 1 and not self.button_x:
+            self.button_x = True
+            self._notify_button_press('x')
+        elif value == 0:
+            self.button_x = False
+
+    def _on_button_y(self, value: int):
+        """Handle Y button event."""
+        if value == 1 and not self.button_y:
+            self.button_y = True
+            self._notify_button_press('y')
+        elif value == 0:
+            self.button_y = False
 
-        # Scale to -255 to 255
-        return int(normalized * 255)
-
-    async def process_event(self, event):
+    async def run(self):
         """
-        Process a single controller event.
+        Main event loop for reading controller input.
 
-        Args:
-            event: evdev InputEvent
+        Returns when stop() is called; a device read error (e.g. controller
+        unplugged) is raised to the caller.
         """
-        if event.type != ecodes.EV_ABS and event.type != ecodes.EV_KEY:
-            return
-
-        updated = False
-
-        # Process trigger events
-        if event.code == self.event_codes['right_trigger']:
-            old_value = self.state['right_trigger']
-            self.state['right_trigger'] = self.normalize_trigger(event.value)
-            updated = old_value != self.state['right_trigger']
-
-        elif event.code == self.event_codes['left_trigger']:
-            old_value = self.state['left_trigger']
-            self.state['left_trigger'] = self.normalize_trigger(event.value)
-            updated = old_value != self.state['left_trigger']
-
-        # Process stick events
-        elif event.code == self.event_codes['left_stick_x']:
-            old_value = self.state['left_stick_x']
-            self.state['left_stick_x'] = self.normalize_stick(event.value)
-            updated = old_value != self.state['left_stick_x']
-
-        # Process button events
-        elif event.code == self.event_codes['button_a']:
-            if event.value == 1 and not self.state['button_a']:  # Button pressed
-                self.state['button_a'] = True
-                if self.on_button_press:
-                    await self.on_button_press('a', True)
-            elif event.value == 0:
-                self.state['button_a'] = False
-
-        elif event.code == self.event_codes['button_b']:
-            if event.value == 1 and not self.state['button_b']:
-                self.state['button_b'] = True
-                if self.on_button_press:
-                    await self.on_button_press('b', True)
-            elif event.value == 0:
-                self.state['button_b'] = False
-
-        elif event.code == self.event_codes['button_x']:
-            if event.value == 1 and not self.state['button_x']:
-                self.state['button_x'] = True
-                if self.on_button_press:
-                    await self.on_button_press('x', True)
-            elif event.value == 0:
-                self.state['button_x'] = False
-
-        elif event.code == self.event_codes['button_y']:
-            if event.value == 1 and not self.state['button_y']:
-                self.state['button_y'] = True
-                if self.on_button_press:
-                    await self.on_button_press('y', True)
-            elif event.value == 0:
-                self.state['button_y'] = False
-
-        # Notify drive update callback if triggers or steering changed
-        if updated and self.on_drive_update:
-            await self.on_drive_update(
-                self.state['right_trigger'],
-                self.state['left_trigger'],
-                self.state['left_stick_x']
-            )
-
-    async def run(self):
-        """Main event loop for reading controller input."""
         if not self.device:
             logger.error("Controller not connected")
             return
 
+        loop = asyncio.get_running_loop()
+        self._stopped = loop.create_future()
         self.running = True
         logger.info("Controller input loop started")
+        drive_pump = asyncio.create_task(self._drive_pump())
+
+        # Wake once per batch of queued events rather than once per event
+        fd = self.device.fd
+        loop.add_reader(fd, self._on_readable)
 
         try:
-            async for event in self.device.async_read_loop():
-                if not self.running:
-                    break
-                await self.process_event(event)
-        except Exception as e:
-            logger.error(f"Error in controller input loop: {e}")
+            await self._stopped
         finally:
+            loop.remove_reader(fd)
+            drive_pump.cancel()
+            for task in list(self._button_tasks):
+                task.cancel()
             self.running = False
             logger.info("Controller input loop stopped")
 
     def stop(self):
         """Stop the controller input loop."""
         self.running = False
+        if self._stopped and not self._stopped.done():
+            self._stopped.set_result(None)
 
     def get_state(self) -> Dict:
         """
@@ -246,4 +362,12 @@ class ControllerInput:
         Returns:
             Dictionary with current state values
         """
-        return self.state.copy()
+        return {
+            'right_trigger': self.right_trigger,
+            'left_trigger': self.left_trigger,
+            'left_stick_x': self.left_stick_x,
+            'button_a': self.button_a,
+            'button_b': self.button_b,
+            'button_x': self.button_x,
+            'button_y': self.button_y,
+        }
@@ -37,7 +37,7 @@ sudo apt-get update
 
 # Install system dependencies
 echo "Installing system dependencies..."
-sudo apt-get install -y python3 python3-pip python3-venv python3-dev
+sudo apt-get install -y python3 python3-pip python3-venv python3-dev libyaml-dev
 
 # Install evdev system package (optional, can also install via pip)
 sudo apt-get install -y python3-evdev
@@ -9,14 +9,26 @@ import asyncio
 import logging
 import signal
 import sys
-import time
 from pathlib import Path
 
 import yaml
 
+# Prefer the libyaml-backed loader; fall back to the pure-Python one
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+try:
+    import uvloop  # Optional: faster event loop
+except ImportError:
+    uvloop = None
+
 from controller_input import ControllerInput
 from rvr_driver import RVRDriver
 
+logger = logging.getLogger(__name__)
+
 
 class RVRController:
     """Main application controller."""
@@ -28,42 +40,34 @@ class RVRController:
         Args:
             config_path: Path to configuration file
         """
-        print(f"RVRController.__init__() called with config_path: {config_path}")
-
         # Load configuration
-        print("Loading configuration...")
         self.config = self.load_config(config_path)
-        print("Configuration loaded successfully")
 
         # Setup logging
-        print("Setting up logging...")
         self.setup_logging()
-        print("Logging configured")
 
         # Initialize components
-        print("Creating ControllerInput...")
         self.controller = ControllerInput(self.config['controller'])
-        print("Creating RVRDriver...")
         self.rvr = RVRDriver(self.config)  # Pass full config (needs rvr, drive, servo sections)
-        print("RVRDriver created")
 
         # Safety settings
         self.input_timeout = self.config['safety']['input_timeout']
         self.stop_on_disconnect = self.config['safety']['stop_on_disconnect']
-        self.last_input_time = time.time()
+        self.reconnect_delay = self.config['rvr'].get('reconnect_delay', 2)
+
+        # Logging settings read on the input path
+        self._log_inputs = self.config['logging'].get('log_inputs', False)
+
+        # Set on every controller input; safety_monitor() waits on it
+        self._input_event = asyncio.Event()
 
         # Runtime state
         self.running = False
-        self.reconnect_task = None
 
         # Register callbacks
         self.controller.on_drive_update = self.on_drive_update
         self.controller.on_button_press = self.on_button_press
 
-        # Register signal handlers for graceful shutdown
-        signal.signal(signal.SIGINT, self.signal_handler)
-        signal.signal(signal.SIGTERM, self.signal_handler)
-
         logger.info("RVR Controller initialized")
 
     def load_config(self, config_path: str) -> dict:
@@ -78,11 +82,11 @@ class RVRController:
         """
         try:
             with open(config_path, 'r') as f:
-                config = yaml.safe_load(f)
-            print(f"Configuration loaded from {config_path}")
+                config = yaml.load(f, Loader=SafeLoader)
+            logger.debug("Configuration loaded from %s", config_path)
             return config
         except Exception as e:
-            print(f"Error loading configuration: {e}")
+            logger.error("Error loading configuration: %s", e)
             sys.exit(1)
 
     def setup_logging(self):
@@ -100,13 +104,22 @@ class RVRController:
         handlers.append(console_handler)
 
         # File handler (if specified)
+        log_file_error = None
         if log_file:
             try:
                 file_handler = logging.FileHandler(log_file)
                 file_handler.setFormatter(logging.Formatter(log_format))
                 handlers.append(file_handler)
             except Exception as e:
-                print(f"Warning: Could not create log file {log_file}: {e}")
+                log_file_error = e
+
+        # Remove existing root handlers so this can be re-run after the Sphero
+        # SDK installs its own logging config (basicConfig's force argument
+        # needs Python 3.8; Raspbian Buster ships 3.7)
+        root_logger = logging.getLogger()
+        for handler in root_logger.handlers[:]:
+            root_logger.removeHandler(handler)
+            handler.close()
 
         # Configure root logger
         logging.basicConfig(
@@ -115,13 +128,20 @@ class RVRController:
             handlers=handlers
         )
 
-        global logger
-        logger = logging.getLogger(__name__)
+        # The SDK's config also disables every logger that already exists
+        # (including asyncio's); re-enable all but the SDK's own
+        for name, existing in logging.root.manager.loggerDict.items():
+            if isinstance(existing, logging.Logger) and name.split('.', 1)[0] != 'sphero_sdk':
+                existing.disabled = False
+
+        if log_file_error:
+            logger.warning("Could not create log file %s: %s", log_file, log_file_error)
 
-    def signal_handler(self, signum, frame):
-        """Handle shutdown signals."""
-        logger.info(f"Received signal {signum}, initiating shutdown...")
+    def _request_shutdown(self, signum: int):
+        """Handle shutdown signals by ending the controller input loop."""
+        logger.info("Received signal %s, initiating shutdown...", signum)
         self.running = False
+        self.controller.stop()
 
     async def on_drive_update(self, throttle: int, reverse: int, steering: int):
         """
@@ -132,12 +152,12 @@ class RVRController:
             reverse: Left trigger value (0-255)
             steering: Left stick X value (-255 to 255)
         """
-        self.last_input_time = time.time()
+        self._input_event.set()
 
-        # Always log for debugging
-        logger.info(f"Drive input received: throttle={throttle}, reverse={reverse}, steering={steering}")
+        logger.debug("Drive input received: throttle=%s, reverse=%s, steering=%s",
+                     throttle, reverse, steering)
 
-        await self.rvr.drive(throttle, reverse, steering)
+        self.rvr.drive(throttle, reverse, steering)
 
     async def on_button_press(self, button: str, pressed: bool):
         """
@@ -150,51 +170,61 @@ class RVRController:
         if not pressed:
             return
 
-        self.last_input_time = time.time()
+        self._input_event.set()
 
-        if self.config['logging'].get('log_inputs', False):
-            logger.debug(f"Button pressed: {button}")
+        if self._log_inputs:
+            logger.debug("Button pressed: %s", button)
 
         # Handle servo control
         await self.rvr.set_servo_preset(button)
 
     async def safety_monitor(self):
-        """Monitor for safety conditions (timeout, disconnection)."""
+        """Emergency stop the RVR if no controller input arrives within input_timeout."""
+        if self.input_timeout <= 0:
+            return
+
+        while True:
+            self._input_event.clear()
+            try:
+                await asyncio.wait_for(self._input_event.wait(), timeout=self.input_timeout)
+            except asyncio.TimeoutError:
+                logger.warning("Input timeout (%ss) - stopping RVR", self.input_timeout)
+                await self.rvr.emergency_stop()
+
+    async def connection_monitor(self):
+        """Reconnect to the RVR whenever its connection is lost."""
+        if not self.stop_on_disconnect:
+            return
+
+        # connection_lost stays set once shutdown begins and reconnect_rvr()
+        # returns immediately, so only loop while running to avoid spinning
         while self.running:
-            # Check input timeout
-            if self.input_timeout > 0:
-                time_since_input = time.time() - self.last_input_time
-                if time_since_input > self.input_timeout:
-                    logger.warning(f"Input timeout ({self.input_timeout}s) - stopping RVR")
-                    await self.rvr.emergency_stop()
-                    self.last_input_time = time.time()  # Reset to avoid repeated stops
-
-            # Check RVR connection
-            if self.stop_on_disconnect and not self.rvr.connected:
-                logger.warning("RVR disconnected - attempting reconnect")
-                if not self.reconnect_task or self.reconnect_task.done():
-                    self.reconnect_task = asyncio.create_task(self.reconnect_rvr())
-
-            await asyncio.sleep(0.5)
+            await self.rvr.connection_lost.wait()
+            logger.warning("RVR disconnected - attempting reconnect")
+            await self.reconnect_rvr()
 
     async def reconnect_rvr(self):
         """Attempt to reconnect to RVR."""
-        reconnect_delay = self.config['rvr'].get('reconnect_delay', 2)
-
         while self.running and not self.rvr.connected:
             logger.info("Attempting to reconnect to RVR...")
             if await self.rvr.connect():
                 logger.info("RVR reconnected successfully")
                 return
             else:
-                logger.error(f"Reconnection failed, retrying in {reconnect_delay}s")
-                await asyncio.sleep(reconnect_delay)
+                logger.error("Reconnection failed, retrying in %ss", self.reconnect_delay)
+                await asyncio.sleep(self.reconnect_delay)
 
     async def run(self):
         """Main application loop."""
         self.running = True
         logger.info("Starting RVR Controller...")
 
+        # Register signal handlers for graceful shutdown (run on the event loop,
+        # so they can stop the input loop cleanly even mid-await)
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, self._request_shutdown, sig)
+
         # Connect to controller
         logger.info("Connecting to controller...")
         if not await self.controller.connect():
@@ -207,6 +237,11 @@ class RVRController:
             logger.error("Failed to connect to RVR")
             return 1
 
+        if not self.running:
+            # Shutdown requested while connecting
+            await self.shutdown()
+            return 0
+
         logger.info("RVR Controller ready!")
         logger.info("Controls:")
         logger.info("  Right Trigger: Forward throttle")
@@ -215,18 +250,26 @@ class RVRController:
         logger.info("  A/B/X/Y Buttons: Servo control")
         logger.info("Press Ctrl+C to stop")
 
+        # Safety monitors run alongside the controller input loop and are
+        # cancelled when it ends (signal, controller error or disconnect)
+        monitors = [
+            asyncio.create_task(self.safety_monitor()),
+            asyncio.create_task(self.connection_monitor()),
+        ]
+
+        # A controller error exits non-zero so systemd restarts the service
+        exit_code = 0
         try:
-            # Start all tasks concurrently
-            await asyncio.gather(
-                self.controller.run(),
-                self.safety_monitor(),
-            )
+            await self.controller.run()
         except Exception as e:
-            logger.error(f"Error in main loop: {e}")
+            logger.error("Error in controller input loop: %s", e)
+            exit_code = 1
         finally:
+            for task in monitors:
+                task.cancel()
             await self.shutdown()
 
-        return 0
+        return exit_code
 
     async def shutdown(self):
         """Graceful shutdown."""
@@ -243,39 +286,52 @@ class RVRController:
         logger.info("Shutdown complete")
 
 
-async def main():
+def main() -> int:
     """Entry point."""
-    print("In main() function...")
-
     # Determine config path
     config_path = 'config.yaml'
     if len(sys.argv) > 1:
         config_path = sys.argv[1]
 
-    print(f"Using config file: {config_path}")
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        # Create controller; the Sphero SDK runs blocking setup on the loop,
+        # so the RVR instance must be created before the loop is running
+        controller = RVRController(config_path)
+        rvr_created = controller.rvr.create_rvr(loop)
+
+        # SpheroRvrAsync.__init__ applies a silent logging config (NullHandler
+        # on the root logger, existing loggers disabled); restore ours
+        controller.setup_logging()
+        if not rvr_created:
+            logger.error("Could not create RVR instance, exiting")
+            return 1
 
-    # Create and run controller
-    print("Creating RVRController instance...")
-    controller = RVRController(config_path)
-    print("RVRController created, calling run()...")
-    return await controller.run()
+        return loop.run_until_complete(controller.run())
+    finally:
+        # Same teardown as asyncio.run(): cancel and drain leftover tasks
+        # (e.g. the RVR command sender when the RVR was never disconnected)
+        try:
+            tasks = asyncio.all_tasks(loop)
+            for task in tasks:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            loop.close()
 
 
 if __name__ == '__main__':
-    print("Starting Sphero RVR Controller...")
-    print(f"Python version: {sys.version}")
+    if uvloop is not None:
+        uvloop.install()
 
     try:
-        print("Calling asyncio.run(main())...")
-        exit_code = asyncio.run(main())
-        print(f"Main returned exit code: {exit_code}")
+        exit_code = main()
         sys.exit(exit_code)
     except KeyboardInterrupt:
-        print("\nInterrupted by user")
+        logger.info("Interrupted by user")
         sys.exit(0)
-    except Exception as e:
-        print(f"Fatal error: {e}")
-        print(f"Exception type: {type(e).__name__}")
-        import traceback
-        print(f"Traceback:\n{traceback.format_exc()}")
+    except Exception:
+        logger.exception("Fatal error")
         sys.exit(1)
@@ -5,23 +5,40 @@ Wrapper around sphero_sdk for drive and servo control
 Optimized for Raspberry Pi Zero W
 """
 
+import array
 import asyncio
 import logging
+import os
 import time
-import traceback
 from typing import Optional
 
-import nest_asyncio
-
 from sphero_sdk import SpheroRvrAsync
 from sphero_sdk import SerialAsyncDal
 from sphero_sdk import RvrLedGroups
 
-# Enable nested event loops (required for Sphero SDK in Python 3.7)
-nest_asyncio.apply()
-
 logger = logging.getLogger(__name__)
 
+# LED payloads for set_all_leds, built once at import. The SDK consumes the
+# list it is given (pops values while packing), so pass a copy: list(_LED_RED)
+_ALL_LIGHTS = RvrLedGroups.all_lights.value
+_LED_GREEN = (0, 255, 0) * 10
+_LED_RED = (255, 0, 0) * 10
+_LED_OFF = (0, 0, 0) * 10
+
+# Seconds to keep polling for a response after waking the RVR
+_WAKE_TIMEOUT = 3.0
+
+# Button to (servo channel, position key) for set_servo_preset
+_BUTTON_MAP = {
+    'a': (0, 'position1'),  # Servo 0, position 1
+    'b': (0, 'position2'),  # Servo 0, position 2
+    'x': (1, 'position1'),  # Servo 1, position 1
+    'y': (1, 'position2'),  # Servo 1, position 2
+}
+
+# Identical raw_motors commands are not resent within this many seconds
+_MOTOR_RESEND_INTERVAL = 0.2
+
 
 class RVRDriver:
     """Driver for controlling Sphero RVR robot."""
@@ -35,10 +52,21 @@ class RVRDriver:
         """
         self.config = config
 
-        # RVR will be initialized in connect() method to avoid event loop issues
+        # RVR is created by create_rvr() before the event loop starts running
         self.rvr = None
+        self._raw_motors = None
+        self._drive_with_heading = None
+
+        # Outbound (command, args) queue, oldest dropped when full, and the
+        # task that sends its commands to the RVR
+        self._cmd_queue = asyncio.Queue(maxsize=2)
+        self._sender_task = None
         self.connected = False
 
+        # Set whenever the RVR is not connected (cleared by a successful connect())
+        self.connection_lost = asyncio.Event()
+        self.connection_lost.set()
+
         # Drive settings
         self.max_speed = config['drive']['max_speed']
         self.min_speed = config['drive']['min_speed']
@@ -46,19 +74,47 @@ class RVRDriver:
         self.steering_sensitivity = config['drive']['steering_sensitivity']
         self.heading_speed = config['drive']['heading_speed']
 
+        # Degrees per second per unit of steering: full steering (255) with
+        # sensitivity 1.0 rotates at heading_speed degrees per second
+        self._heading_rate = self.steering_sensitivity * self.heading_speed / 255
+
+        # Logging settings (cached so drive() doesn't walk the config per call)
+        self._log_commands = config['logging'].get('log_commands', False)
+
+        # Speed magnitude lookup table indexed by trigger value (0-255)
+        self._speed_lut = array.array('h', [0] * 256)
+        for value in range(1, 256):
+            self._speed_lut[value] = self._raw_calc_speed(value)
+
+        # raw_motors command lookup table indexed by steering + 255 (steering is -255 to 255)
+        self._motor_lut = tuple(
+            self.compute_motor_from_steering(s) for s in range(-255, 256)
+        )
+
         # Servo settings
         self.servo_enabled = config['servo']['enabled']
-        self.servo_configs = {s['channel']: s for s in config['servo']['servos']}
+        self.servo_configs = [None] * 4  # Indexed by channel 0-3, None if not configured
+        for servo_config in config['servo']['servos']:
+            channel = servo_config['channel']
+            if 0 <= channel < 4:
+                self.servo_configs[channel] = servo_config
+            else:
+                logger.warning("Ignoring servo with invalid channel %s. Must be 0-3.", channel)
 
         # Current state
         self.current_speed = 0
         self.current_heading = 0  # Accumulated heading (0-359)
-        self.last_update_time = time.time()
-        self.servo_positions = {}
+        self._last_input = None  # (throttle, reverse, steering) of the last drive()
+        self._last_motor_cmd = None  # Last raw_motors command queued
+        self._last_motor_time = 0.0
+        self._last_led = None  # LED payload constant last sent with set_all_leds
+        self.last_update_time = time.monotonic()
+        self.servo_positions = array.array('B', [128] * 4)  # Indexed by channel 0-3
 
         # Initialize servo positions to neutral
-        for channel, servo_config in self.servo_configs.items():
-            self.servo_positions[channel] = servo_config['positions']['neutral']
+        for channel, servo_config in enumerate(self.servo_configs):
+            if servo_config is not None:
+                self.servo_positions[channel] = servo_config['positions']['neutral']
 
     async def connect(self) -> bool:
         """
@@ -67,91 +123,156 @@ class RVRDriver:
         Returns:
             True if connection successful, False otherwise
         """
-        print("RVRDriver.connect() called")
-        try:
-            # Initialize RVR with SerialAsyncDal (must be done in async context)
-            if self.rvr is None:
-                print("Creating SerialAsyncDal...")
-                logger.debug("Creating SerialAsyncDal...")
-                loop = asyncio.get_running_loop()
-                print(f"Got running loop: {loop}")
-                self.rvr = SpheroRvrAsync(dal=SerialAsyncDal(loop))
-                print("SpheroRvrAsync instance created")
-                logger.info("RVR instance created with SerialAsyncDal")
+        if self.rvr is None:
+            logger.error("RVR instance unavailable")
+            return False
 
+        try:
             logger.info("Waking RVR via UART...")
-            print("=" * 60)
-            print("SENDING WAKE COMMAND TO RVR")
-            print("=" * 60)
 
             # Try waking multiple times to ensure it works
             for attempt in range(3):
-                print(f"Wake attempt {attempt + 1}/3...")
+                logger.info("Wake attempt %d/3...", attempt + 1)
                 await self.rvr.wake()
                 await asyncio.sleep(1)
 
-            print("Wake commands sent, waiting for RVR to fully wake...")
-            logger.debug("Wake commands sent, waiting 2 seconds...")
-            await asyncio.sleep(2)  # Give RVR time to wake up
-
-            print("Verifying connection with battery request...")
-            logger.debug("Requesting battery percentage...")
-            # Test connection with battery percentage request
-            battery = await self.rvr.get_battery_percentage()
-            logger.info(f"Connected to RVR. Battery: {battery['percentage']}%")
-            print(f"Battery: {battery['percentage']}% - RVR IS AWAKE!")
+            # Poll with battery percentage requests until the RVR answers,
+            # rather than sleeping a fixed time for it to wake up
+            logger.info("Wake commands sent, verifying connection with battery request...")
+            deadline = time.monotonic() + _WAKE_TIMEOUT
+            while True:
+                # Use the SDK's own timeout: cancelling the request from outside
+                # (asyncio.wait_for) leaves its shielded response wait pending
+                try:
+                    battery = await self.rvr.get_battery_percentage(timeout=0.5)
+                    break
+                except asyncio.CancelledError:
+                    raise  # An Exception subclass on Python 3.7
+                except Exception:
+                    # asyncio.TimeoutError, or the SDK's error-code Exception
+                    if time.monotonic() > deadline:
+                        raise
+                    await asyncio.sleep(0.1)
+            logger.info("Connected to RVR. Battery: %s%%", battery['percentage'])
 
             logger.debug("Setting LED colors to green...")
             # Set LEDs to indicate ready state (green)
-            await self.rvr.set_all_leds(
-                led_group=RvrLedGroups.all_lights.value,
-                led_brightness_values=[0, 255, 0] * 10  # Green
-            )
+            await self._set_leds(_LED_GREEN)
             logger.debug("LEDs set successfully")
 
             self.connected = True
-            print("=" * 60)
-            print("RVR CONNECTED SUCCESSFULLY - CODE VERSION: 2025-11-16-v2")
-            print("=" * 60)
+            self.connection_lost.clear()
+            if self._sender_task is None or self._sender_task.done():
+                self._sender_task = asyncio.create_task(self._sender_loop())
             logger.info("=" * 60)
             logger.info("RVR CONNECTED SUCCESSFULLY - CODE VERSION: 2025-11-16-v2")
             logger.info("=" * 60)
             return True
 
-        except Exception as e:
-            print(f"EXCEPTION in RVRDriver.connect(): {e}")
-            print(f"Exception type: {type(e).__name__}")
-            print(f"Traceback:\n{traceback.format_exc()}")
-            logger.error(f"Failed to connect to RVR: {e}")
-            logger.error(f"Exception type: {type(e).__name__}")
-            logger.error(f"Traceback:\n{traceback.format_exc()}")
+        except asyncio.CancelledError:
+            raise  # An Exception subclass on Python 3.7
+        except Exception:
+            logger.exception("Failed to connect to RVR")
             self.connected = False
+            self.connection_lost.set()
             return False
 
+    def create_rvr(self, loop: asyncio.AbstractEventLoop) -> bool:
+        """
+        Create the RVR instance with SerialAsyncDal.
+
+        Must be called before the event loop is running: the SDK constructor
+        runs its firmware check with loop.run_until_complete().
+
+        Args:
+            loop: Event loop the application will run on
+
+        Returns:
+            True if the RVR instance was created, False otherwise
+        """
+        logger.debug("Creating SerialAsyncDal...")
+        try:
+            self.rvr = SpheroRvrAsync(dal=SerialAsyncDal(loop))
+        except Exception as e:
+            logger.error("Failed to create RVR instance: %s", e)
+            return False
+        logger.info("RVR instance created with SerialAsyncDal")
+        self._last_led = None
+
+        # Pre-bind the drive commands used on the hot path
+        self._raw_motors = self.rvr.raw_motors
+        self._drive_with_heading = self.rvr.drive_with_heading
+
+        self._enable_low_latency()
+        return True
+
+    def _enable_low_latency(self):
+        """
+        Ask the serial driver to deliver bytes without batching delay.
+
+        Sets ASYNC_LOW_LATENCY on the tty and, for USB-serial adapters, lowers
+        the latency_timer (16 ms by default on FTDI) to 1 ms. Best effort:
+        unsupported adapters or missing permissions leave the defaults.
+        """
+        try:
+            # The SDK doesn't expose the pyserial handle; reach it via the transport
+            port = self.rvr._dal._SerialSpheroPort__transport.serial
+        except AttributeError:
+            logger.debug("Serial port handle not available, low latency mode not set")
+            return
+
+        try:
+            port.set_low_latency_mode(True)
+            logger.debug("Low latency mode enabled on %s", port.port)
+        except (AttributeError, OSError, ValueError) as e:
+            logger.debug("Could not enable low latency mode on %s: %s", port.port, e)
+
+        tty = os.path.basename(os.path.realpath(port.port))
+        try:
+            with open(f'/sys/bus/usb-serial/devices/{tty}/latency_timer', 'w') as f:
+                f.write('1')
+        except OSError:
+            pass  # Not a USB-serial adapter, or not writable
+
     async def disconnect(self):
         """Disconnect from RVR."""
         if self.connected:
             try:
-                # Stop movement
-                await self.stop()
+                if self._sender_task:
+                    self._sender_task.cancel()
+                    self._sender_task = None
 
-                # Reset servos to neutral
+                # Stop movement, reset servos to neutral and set LEDs to
+                # indicate shutdown (red); these are independent, so issue them together
+                shutdown = [self.stop(), self._set_leds(_LED_RED)]
                 if self.servo_enabled:
-                    await self.reset_servos()
-
-                # Set LEDs to indicate shutdown (red)
-                await self.rvr.set_all_leds(
-                    led_group=RvrLedGroups.all_lights.value,
-                    led_brightness_values=[255, 0, 0] * 10  # Red
-                )
+                    shutdown.append(self.reset_servos())
+                for result in await asyncio.gather(*shutdown, return_exceptions=True):
+                    if isinstance(result, Exception):
+                        logger.error("Error during disconnect: %s", result)
 
-                await asyncio.sleep(0.5)
                 await self.rvr.close()
                 logger.info("Disconnected from RVR")
             except Exception as e:
-                logger.error(f"Error during disconnect: {e}")
+                logger.error("Error during disconnect: %s", e)
             finally:
                 self.connected = False
+                self.connection_lost.set()
+
+    async def _set_leds(self, leds: tuple):
+        """
+        Set all LEDs, skipping the UART write if they already show this payload.
+
+        Args:
+            leds: One of the module-level LED payloads (_LED_GREEN, _LED_RED, _LED_OFF)
+        """
+        if leds is self._last_led:
+            return
+        await self.rvr.set_all_leds(
+            led_group=_ALL_LIGHTS,
+            led_brightness_values=list(leds)
+        )
+        self._last_led = leds
 
     def calculate_speed(self, throttle: int, reverse: int) -> int:
         """
@@ -165,29 +286,32 @@ class RVRDriver:
             Signed speed value (-255 to 255), negative for reverse
         """
         # Both triggers cancel out
-        if throttle > 0 and reverse > 0:
+        if throttle and reverse:
             return 0
 
-        # Calculate raw speed
-        if throttle > 0:
-            raw_speed = throttle
-        elif reverse > 0:
-            raw_speed = -reverse
-        else:
-            return 0
+        if throttle:
+            return self._speed_lut[throttle]
+        return -self._speed_lut[reverse]
 
-        # Apply speed scaling
-        scaled_speed = int(raw_speed * self.speed_scale)
+    def _raw_calc_speed(self, raw_speed: int) -> int:
+        """
+        Calculate forward speed magnitude for a single trigger value.
 
-        # Apply minimum speed threshold to overcome static friction
-        if abs(scaled_speed) > 0 and abs(scaled_speed) < self.min_speed:
-            scaled_speed = self.min_speed if scaled_speed > 0 else -self.min_speed
+        Used to build the speed lookup table; reverse is the negation.
 
-        # Clamp to max speed
-        if abs(scaled_speed) > self.max_speed:
-            scaled_speed = self.max_speed if scaled_speed > 0 else -self.max_speed
+        Args:
+            raw_speed: Trigger value (1-255)
 
-        return scaled_speed
+        Returns:
+            Scaled and clamped speed (0 to max_speed)
+        """
+        # Apply speed scaling
+        scaled_speed = int(raw_speed * self.speed_scale)
+        if scaled_speed == 0:
+            return 0
+
+        # Raise to minimum speed (to overcome static friction), then clamp to max speed
+        return min(max(scaled_speed, self.min_speed), self.max_speed)
 
     def calculate_heading_delta(self, steering: int, delta_time: float) -> int:
         """
@@ -200,29 +324,55 @@ class RVRDriver:
         Returns:
             Heading change in degrees
         """
-        if steering == 0:
-            # No steering input, no heading change
-            return 0
+        # Rotation rate is steering scaled by _heading_rate (no steering, no change)
+        return int(steering * self._heading_rate * delta_time)
+
+    def calculate_turn_speed(self, steering: int) -> int:
+        """
+        Calculate in-place turn motor speed from steering input.
 
-        # Apply steering sensitivity
-        adjusted_steering = steering * self.steering_sensitivity
+        Args:
+            steering: Left stick X value (-255 to 255)
 
-        # Calculate rotation rate based on steering input
-        # Max rotation rate is heading_speed degrees per second
-        # Steering range: -255 (left) to 255 (right)
-        rotation_rate = (adjusted_steering / 255) * self.heading_speed
+        Returns:
+            Motor speed (40-100) for turning in place
+        """
+        turn_speed = abs(steering) * 3 // 10  # 30% of steering, integer only
+        # Clamp between 40-100
+        return 100 if turn_speed > 100 else 40 if turn_speed < 40 else turn_speed
 
-        # Calculate heading change over the time delta
-        heading_delta = int(rotation_rate * delta_time)
+    def compute_motor_from_steering(self, steering: int) -> tuple:
+        """
+        Compute the raw_motors command for a steering input.
 
-        return heading_delta
+        Args:
+            steering: Left stick X value (-255 to 255)
 
-    async def drive(self, throttle: int, reverse: int, steering: int):
+        Returns:
+            (left_mode, left_speed, right_mode, right_speed) where mode 1 is
+            forward and 2 is reverse
+        """
+        if not steering:
+            # Steering released - stop motors
+            return (1, 0, 1, 0)
+
+        # Turn in place using raw motors
+        # Positive steering (right) = left forward, right backward
+        # Negative steering (left) = left backward, right forward
+        turn_speed = self.calculate_turn_speed(steering)
+        if steering > 0:
+            return (1, turn_speed, 2, turn_speed)
+        return (2, turn_speed, 1, turn_speed)
+
+    def drive(self, throttle: int, reverse: int, steering: int):
         """
         Drive the RVR based on controller input.
         SIMPLIFIED: Only steering for now, throttle/reverse ignored.
         VERSION: 2025-11-16-v2
 
+        Does not wait for the UART: the motor command is queued for
+        _sender_loop(), dropping the oldest pending command if the queue is full.
+
         Args:
             throttle: Right trigger value (0-255) - IGNORED
             reverse: Left trigger value (0-255) - IGNORED
@@ -232,63 +382,90 @@ class RVRDriver:
             logger.warning("Cannot drive: RVR not connected")
             return
 
-        try:
-            print(f"[DRIVE] Steering input: {steering}")
-            logger.info(f"Steering input: {steering}")
-
-            # Only handle steering
-            if abs(steering) > 0:
-                # Turn in place using raw motors
-                # Positive steering (right) = left forward, right backward
-                # Negative steering (left) = left backward, right forward
-
-                turn_speed = int(abs(steering) * 0.3)
-                turn_speed = max(40, min(turn_speed, 100))  # Clamp between 40-100
-
-                if steering > 0:
-                    # Turn right
-                    left_speed = turn_speed
-                    right_speed = -turn_speed
-                else:
-                    # Turn left
-                    left_speed = -turn_speed
-                    right_speed = turn_speed
-
-                logger.info(f"Turning: left_speed={left_speed}, right_speed={right_speed}")
-
-                await self.rvr.raw_motors(
-                    left_mode=1 if left_speed >= 0 else 2,
-                    left_speed=abs(left_speed),
-                    right_mode=1 if right_speed >= 0 else 2,
-                    right_speed=abs(right_speed)
-                )
+        # Nothing to do if the inputs haven't changed since the last command
+        key = (throttle, reverse, steering)
+        if key == self._last_input:
+            return
+        self._last_input = key
+
+        if self._log_commands:
+            logger.debug("Steering input: %d", steering)
+
+        # Only handle steering
+        cmd = self._motor_lut[steering + 255]
+
+        if self._log_commands and logger.isEnabledFor(logging.DEBUG):
+            if steering:
+                left_speed = cmd[1] if cmd[0] == 1 else -cmd[1]
+                logger.debug("Turning: left_speed=%d, right_speed=%d", left_speed, -left_speed)
             else:
-                # Steering released - stop motors
-                logger.info("Stopping motors")
-                await self.rvr.raw_motors(
-                    left_mode=1,
-                    left_speed=0,
-                    right_mode=1,
-                    right_speed=0
-                )
+                logger.debug("Stopping motors")
 
-        except Exception as e:
-            logger.error(f"Error in drive command: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+        self._queue_motors(cmd)
+
+    def _queue_motors(self, cmd: tuple):
+        """
+        Queue a raw_motors command for _sender_loop().
+
+        A command identical to the last one queued is skipped unless it was
+        queued more than _MOTOR_RESEND_INTERVAL seconds ago.
+
+        Args:
+            cmd: (left_mode, left_speed, right_mode, right_speed)
+        """
+        now = time.monotonic()
+        if cmd == self._last_motor_cmd and now - self._last_motor_time < _MOTOR_RESEND_INTERVAL:
+            return
+        self._last_motor_cmd = cmd
+        self._last_motor_time = now
+
+        self._queue_command(self._raw_motors, cmd)
+
+    def _queue_command(self, fn, args: tuple):
+        """
+        Queue an RVR command, dropping the oldest pending one if the queue is full.
+
+        Args:
+            fn: SDK coroutine function to call
+            args: Positional arguments for fn
+        """
+        try:
+            self._cmd_queue.put_nowait((fn, args))
+        except asyncio.QueueFull:
+            self._cmd_queue.get_nowait()
+            self._cmd_queue.put_nowait((fn, args))
+
+    def _drop_queued_commands(self):
+        """Discard queued commands that have not been sent yet."""
+        while not self._cmd_queue.empty():
+            self._cmd_queue.get_nowait()
+
+    async def _sender_loop(self):
+        """Send queued commands to the RVR as the UART allows."""
+        while True:
+            fn, args = await self._cmd_queue.get()
+            try:
+                await fn(*args)
+            except Exception as e:
+                logger.error("Error sending RVR command: %s", e)
 
     async def stop(self):
         """Stop the RVR."""
         if not self.connected:
             return
 
+        # Don't let a motor command queued before the stop run after it
+        self._drop_queued_commands()
+        self._last_input = None
+        self._last_motor_cmd = None
+
         try:
             # Stop but maintain current heading
-            await self.rvr.drive_with_heading(speed=0, heading=self.current_heading, flags=0)
+            await self._drive_with_heading(0, self.current_heading, 0)  # speed, heading, flags
             self.current_speed = 0
-            logger.info(f"RVR stopped at heading {self.current_heading}")
+            logger.info("RVR stopped at heading %s", self.current_heading)
         except Exception as e:
-            logger.error(f"Error stopping RVR: {e}")
+            logger.error("Error stopping RVR: %s", e)
 
     async def set_servo(self, channel: int, position: int):
         """
@@ -322,17 +499,17 @@ class RVRDriver:
                     await self.rvr.set_all_pwms(pwm_duties)
                 except AttributeError:
                     # Fallback: log warning if method doesn't exist
-                    logger.warning(f"Servo control not available in this SDK version. "
-                                 f"Channel {channel} position {position} requested but not set.")
+                    logger.warning("Servo control not available in this SDK version. "
+                                   "Channel %s position %s requested but not set.", channel, position)
                     return
 
                 self.servo_positions[channel] = position
-                logger.info(f"Servo {channel} set to position {position}")
+                logger.info("Servo %s set to position %s", channel, position)
             else:
-                logger.warning(f"Invalid servo channel {channel}. Must be 0-3.")
+                logger.warning("Invalid servo channel %s. Must be 0-3.", channel)
 
         except Exception as e:
-            logger.error(f"Error setting servo {channel}: {e}")
+            logger.error("Error setting servo %s: %s", channel, e)
 
     async def set_servo_preset(self, button: str):
         """
@@ -344,24 +521,17 @@ class RVRDriver:
         if not self.servo_enabled:
             return
 
-        # Map buttons to servo channels and positions
-        button_map = {
-            'a': (0, 'position1'),  # Servo 0, position 1
-            'b': (0, 'position2'),  # Servo 0, position 2
-            'x': (1, 'position1'),  # Servo 1, position 1
-            'y': (1, 'position2'),  # Servo 1, position 2
-        }
-
-        if button not in button_map:
+        preset = _BUTTON_MAP.get(button)
+        if preset is None:
             return
+        channel, position_key = preset
 
-        channel, position_key = button_map[button]
-
-        if channel not in self.servo_configs:
-            logger.warning(f"Servo channel {channel} not configured")
+        servo_config = self.servo_configs[channel]
+        if servo_config is None:
+            logger.warning("Servo channel %s not configured", channel)
             return
 
-        position = self.servo_configs[channel]['positions'][position_key]
+        position = servo_config['positions'][position_key]
         await self.set_servo(channel, position)
 
     async def reset_servos(self):
@@ -369,9 +539,9 @@ class RVRDriver:
         if not self.servo_enabled:
             return
 
-        for channel, servo_config in self.servo_configs.items():
-            neutral = servo_config['positions']['neutral']
-            await self.set_servo(channel, neutral)
+        for channel, servo_config in enumerate(self.servo_configs):
+            if servo_config is not None:
+                await self.set_servo(channel, servo_config['positions']['neutral'])
 
         logger.info("All servos reset to neutral")
 
@@ -380,21 +550,25 @@ class RVRDriver:
         logger.warning("EMERGENCY STOP")
 
         try:
-            await self.stop()
-            await self.rvr.reset_yaw()
-
-            # Flash LEDs red to indicate emergency stop
-            for _ in range(3):
-                await self.rvr.set_all_leds(
-                    led_group=RvrLedGroups.all_lights.value,
-                    led_brightness_values=[255, 0, 0] * 10
-                )
-                await asyncio.sleep(0.2)
-                await self.rvr.set_all_leds(
-                    led_group=RvrLedGroups.all_lights.value,
-                    led_brightness_values=[0, 0, 0] * 10
-                )
-                await asyncio.sleep(0.2)
-
+            # Stop and yaw reset are independent; issue them together
+            _, yaw_result = await asyncio.gather(
+                self.stop(), self.rvr.reset_yaw(), return_exceptions=True
+            )
+            if isinstance(yaw_result, Exception):
+                logger.error("Error resetting yaw: %s", yaw_result)
+
+            # Flash LEDs red to indicate emergency stop. Every write must go
+            # out, so forget the cached LED state before each one
+            set_leds = self._set_leds
+            for _ in range(2):
+                self._last_led = None
+                await set_leds(_LED_RED)
+                await asyncio.sleep(0.1)
+                self._last_led = None
+                await set_leds(_LED_OFF)
+                await asyncio.sleep(0.1)
+
+        except asyncio.CancelledError:
+            raise  # An Exception subclass on Python 3.7
         except Exception as e:
-            logger.error(f"Error during emergency stop: {e}")
+            logger.error("Error during emergency stop: %s", e)